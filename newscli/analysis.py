@@ -1,11 +1,25 @@
 from __future__ import annotations
 
+import bisect
+import hashlib
 from dataclasses import dataclass
+from functools import cache, lru_cache
 from typing import Optional
 
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
-_analyzer = SentimentIntensityAnalyzer()
+from . import tone_cache
+
+# Rough heuristic: highly polar sentiment often correlates with opinionated tone.
+# |compound| below each threshold maps to the hint at the same index.
+_HINT_THRESHOLDS = (0.1, 0.35)
+_HINTS = ("Mostly neutral language", "Mildly opinionated tone", "Strongly opinionated tone")
+
+
+@cache
+def _get_analyzer() -> SentimentIntensityAnalyzer:
+    # Loading the VADER lexicon is slow; defer it until a tone is first needed.
+    return SentimentIntensityAnalyzer()
 
 
 @dataclass(frozen=True)
@@ -17,23 +31,73 @@ class ToneScore:
     subjectivity_hint: str
 
 
+# What VADER returns for text with no lexicon words (numbers, URLs, punctuation).
+_NEUTRAL = ToneScore(sentiment=0.0, pos=0.0, neu=1.0, neg=0.0, subjectivity_hint=_HINTS[0])
+
+
 def analyze_tone(text: str) -> Optional[ToneScore]:
     cleaned = " ".join(text.split())
     if not cleaned:
         return None
-    scores = _analyzer.polarity_scores(cleaned)
-    compound = float(scores.get("compound", 0.0))
-    pos = float(scores.get("pos", 0.0))
-    neu = float(scores.get("neu", 0.0))
-    neg = float(scores.get("neg", 0.0))
-
-    # Rough heuristic: highly polar sentiment often correlates with opinionated tone.
-    if abs(compound) < 0.1:
-        hint = "Mostly neutral language"
-    elif abs(compound) < 0.35:
-        hint = "Mildly opinionated tone"
-    else:
-        hint = "Strongly opinionated tone"
+    if not any(c.isalpha() for c in cleaned):
+        return _NEUTRAL
+    return _analyze_cleaned(cleaned)
+
+
+def analyze_tones(texts: list[str]) -> list[Optional[ToneScore]]:
+    """Score a batch of texts in one call (e.g. a whole feed)."""
+    out: list[Optional[ToneScore]] = []
+    # Output slot -> cleaned text still to score, and cleaned text -> cache key.
+    todo: list[tuple[int, str]] = []
+    keys: dict[str, str] = {}
+    for text in texts:
+        cleaned = " ".join(text.split())
+        if not cleaned:
+            out.append(None)
+        elif not any(c.isalpha() for c in cleaned):
+            out.append(_NEUTRAL)
+        else:
+            if cleaned not in keys:
+                keys[cleaned] = _cache_key(cleaned)
+            todo.append((len(out), cleaned))
+            out.append(None)
+    if not todo:
+        return out
+
+    # One query for the whole batch, and one transaction for whatever missed.
+    cached = tone_cache.get_many(list(keys.values()))
+    missed: list[tuple[str, tone_cache.Scores]] = []
+    tones: dict[str, ToneScore] = {}
+    for cleaned, key in keys.items():
+        scores = cached.get(key)
+        if scores is None:
+            scores = _vader_scores(cleaned)
+            missed.append((key, scores))
+        tones[cleaned] = _to_tone(scores)
+    tone_cache.put_many(missed)
+
+    for i, cleaned in todo:
+        out[i] = tones[cleaned]
+    return out
+
+
+def _cache_key(cleaned: str) -> str:
+    return hashlib.blake2b(cleaned.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _vader_scores(cleaned: str) -> tone_cache.Scores:
+    scores = _get_analyzer().polarity_scores(cleaned)
+    return (
+        float(scores.get("compound", 0.0)),
+        float(scores.get("pos", 0.0)),
+        float(scores.get("neu", 0.0)),
+        float(scores.get("neg", 0.0)),
+    )
+
+
+def _to_tone(scores: tone_cache.Scores) -> ToneScore:
+    compound, pos, neu, neg = scores
+    hint = _HINTS[bisect.bisect_right(_HINT_THRESHOLDS, abs(compound))]
 
     return ToneScore(
         sentiment=compound,
@@ -42,3 +106,16 @@ def analyze_tone(text: str) -> Optional[ToneScore]:
         neg=neg,
         subjectivity_hint=hint,
     )
+
+
+@lru_cache(maxsize=1024)
+def _analyze_cleaned(cleaned: str) -> ToneScore:
+    # VADER is deterministic per text and the detail pane re-renders often, so
+    # repeated renders of the same article become a cache lookup. Results are
+    # also persisted so headlines seen in an earlier session skip VADER.
+    key = _cache_key(cleaned)
+    scores = tone_cache.get(key)
+    if scores is None:
+        scores = _vader_scores(cleaned)
+        tone_cache.put(key, scores)
+    return _to_tone(scores)
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
-import base64
 import asyncio
+import dataclasses
 import datetime as dt
+import json
 import os
+import time
 import webbrowser
-from typing import List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator, List, Optional
 
 import httpx
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
@@ -27,10 +32,61 @@ from textual.reactive import reactive
 from textual.screen import ModalScreen
 from textual.widgets import Footer, Header, ListItem, ListView, Static
 
+try:
+    # SIMD base64 from the optional "fast" extra; same output as the stdlib.
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 from .article import ArticleContent, extract_readable_text, fetch_article_text
-from .analysis import analyze_tone
-from .config import Source, load_sources
-from .rss import Article, fetch_feed, parse_feed
+from .analysis import ToneScore, analyze_tone, analyze_tones
+from .config import Source, cache_dir, load_sources
+from .net import close_client, get_client
+from .rss import Article, fetch_feed, parse_feed_async
+
+
+# VADER is CPU-bound pure Python; keep it off the event loop thread. It holds
+# the GIL, so more than one worker would only contend for it.
+_tone_pool: ThreadPoolExecutor | None = None
+
+
+def _get_tone_pool() -> ThreadPoolExecutor:
+    global _tone_pool
+    if _tone_pool is None:
+        _tone_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="newscli-tone")
+    return _tone_pool
+
+
+def _shutdown_tone_pool() -> None:
+    global _tone_pool
+    if _tone_pool is not None:
+        _tone_pool.shutdown(wait=False, cancel_futures=True)
+        _tone_pool = None
+
+
+async def _cancel_task(task: asyncio.Task | None) -> None:
+    """Cancel a background task and wait for it to finish unwinding."""
+    if task is None or task.done():
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+async def _with_tones(articles: List[Article]) -> List[Article]:
+    """Return copies of ``articles`` with their tone precomputed in a worker pool."""
+    loop = asyncio.get_running_loop()
+    texts = [f"{art.title}\n{art.summary}" for art in articles]
+    # One executor job for the whole feed rather than one per article.
+    tones = await loop.run_in_executor(_get_tone_pool(), analyze_tones, texts)
+    return [dataclasses.replace(art, tone=tone) for art, tone in zip(articles, tones)]
 
 
 def _kitty_images_enabled() -> bool:
@@ -50,12 +106,11 @@ def _is_kitty_terminal() -> bool:
     )
 
 
-async def _fetch_image_bytes(url: str) -> bytes:
+async def _fetch_image_bytes(url: str, client: httpx.AsyncClient | None = None) -> bytes:
     headers = {"User-Agent": "Mozilla/5.0"}
-    async with httpx.AsyncClient(follow_redirects=True, timeout=15) as client:
-        resp = await client.get(url, headers=headers)
-        resp.raise_for_status()
-        return resp.content
+    resp = await (client or get_client()).get(url, headers=headers, timeout=15)
+    resp.raise_for_status()
+    return resp.content
 
 
 def _image_cell_size(screen_width: int) -> tuple[int, int]:
@@ -64,36 +119,67 @@ def _image_cell_size(screen_width: int) -> tuple[int, int]:
     return cols, rows
 
 
-def _kitty_image_escape(data: bytes, cols: int, rows: int) -> str:
-    """Return Kitty graphics protocol escape sequence for image bytes."""
-    b64 = base64.b64encode(data).decode("ascii")
+def _iter_kitty_image_escape(b64: bytes, cols: int, rows: int) -> Iterator[str]:
+    """Yield the Kitty graphics protocol escape for base64 image data, one chunk at a time."""
+    # Slicing a memoryview doesn't copy, so each chunk is decoded straight out
+    # of the encoded buffer without an intermediate bytes object.
+    view = memoryview(b64)
     chunk_size = 4096
-    chunks = [b64[i : i + chunk_size] for i in range(0, len(b64), chunk_size)]
-    parts: list[str] = []
-    for i, chunk in enumerate(chunks):
-        more = 1 if i < len(chunks) - 1 else 0
-        if i == 0:
+    total = len(b64)
+    for start in range(0, total, chunk_size):
+        more = 1 if start + chunk_size < total else 0
+        if start == 0:
             params = f"a=T,t=d,c={cols},r={rows},m={more}"
         else:
             params = f"m={more}"
-        parts.append(f"\x1b_G{params};{chunk}\x1b\\")
-    return "".join(parts)
+        # Decode per chunk so the full payload never exists as a second str.
+        chunk = str(view[start : start + chunk_size], "ascii")
+        yield f"\x1b_G{params};{chunk}\x1b\\"
+
+
+def _kitty_image_escape(data: bytes, cols: int, rows: int) -> str:
+    """Return Kitty graphics protocol escape sequence for image bytes."""
+    return "".join(_iter_kitty_image_escape(b64encode(data), cols, rows))
 
 
 class KittyImageRenderable:
     """Rich renderable that emits Kitty image escapes."""
 
-    def __init__(self, esc: str, rows: int) -> None:
-        self.esc = esc
+    def __init__(self, data: bytes, cols: int, rows: int) -> None:
+        self.cols = cols
         self.rows = rows
+        # Encoded once here; every repaint re-renders, and only slices this.
+        self._b64 = b64encode(data)
 
     def __rich_console__(self, console, options):
         from rich.segment import Segment
-        yield Segment(self.esc)
-        # Reserve rows so following text doesn't overlap.
+        for chunk in _iter_kitty_image_escape(self._b64, self.cols, self.rows):
+            yield Segment(chunk)
+        # Reserve rows so following text doesn't overlap. These have to be real
+        # line breaks: Textual lays out and crops by segment lines, so a
+        # cursor-down escape would take no space and the text below would be
+        # drawn over the image.
         yield Segment("\n" * self.rows)
 
 
+def _images_panel(renderable) -> Panel:
+    return Panel(
+        renderable,
+        title="Images",
+        border_style="#9fe870",
+        box=box.SQUARE,
+        padding=(0, 1),
+    )
+
+
+def _image_urls_panel(image_urls: list[str]) -> Panel:
+    urls = Text()
+    for idx, img_url in enumerate(image_urls[:3], start=1):
+        urls.append(f"{idx}. ", style="bold")
+        urls.append(img_url + "\n", style="underline")
+    return _images_panel(urls)
+
+
 class SourceSelected(Message):
     def __init__(self, source: Source) -> None:
         super().__init__()
@@ -108,15 +194,10 @@ class ArticleSelected(Message):
 
 class SourcesList(ListView):
     def __init__(self, sources: List[Source], **kwargs) -> None:
-        super().__init__(**kwargs)
+        # Hand the items over as children so they mount with the list itself.
+        super().__init__(*[ListItem(Static(src.name)) for src in sources], **kwargs)
         self.sources = sources
 
-    def on_mount(self) -> None:
-        for src in self.sources:
-            self.append(ListItem(Static(src.name)))
-        if self.sources:
-            self.index = 0
-
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         idx = event.list_view.index or 0
         self.post_message(SourceSelected(self.sources[idx]))
@@ -132,10 +213,11 @@ class ArticlesList(ListView):
 
     def set_articles(self, articles: List[Article]) -> None:
         self.articles = articles
-        self.clear()
-        for art in articles:
-            author = f" — {art.author}" if art.author else ""
-            self.append(ListItem(Static(f"{art.title}{author}")))
+        items = [ListItem(Static(art.display_label or art.title)) for art in articles]
+        # Swap the whole list in one update instead of relayouting per item.
+        with self.app.batch_update():
+            self.clear()
+            self.extend(items)
         if articles:
             self.index = 0
 
@@ -200,63 +282,32 @@ class ArticleReader(ModalScreen):
             padding=(1, 1),
         )
 
-        renderables: list[object] = [header_panel]
-
-        if content.images:
-            if _kitty_images_enabled() and _is_kitty_terminal():
-                # Fetch and render up to 2 images inline via Kitty protocol.
-                images = []
-                for img_url in content.images[:2]:
-                    try:
-                        data = await _fetch_image_bytes(img_url)
-                    except Exception:
-                        continue
-                    cols, rows = _image_cell_size(self.app.size.width if hasattr(self.app, "size") else 80)
-                    esc = _kitty_image_escape(data, cols=cols, rows=rows)
-                    images.append(KittyImageRenderable(esc, rows=rows))
-                if images:
-                    renderables.append(
-                        Panel(
-                            Group(*images),
-                            title="Images",
-                            border_style="#9fe870",
-                            box=box.SQUARE,
-                            padding=(0, 1),
-                        )
-                    )
-                else:
-                    # Fallback to URLs if we couldn't render.
-                    urls = Text()
-                    for idx, img_url in enumerate(content.images[:3], start=1):
-                        urls.append(f"{idx}. ", style="bold")
-                        urls.append(img_url + "\n", style="underline")
-                    renderables.append(
-                        Panel(
-                            urls,
-                            title="Images",
-                            border_style="#9fe870",
-                            box=box.SQUARE,
-                            padding=(0, 1),
-                        )
-                    )
-            else:
-                urls = Text()
-                for idx, img_url in enumerate(content.images[:3], start=1):
-                    urls.append(f"{idx}. ", style="bold")
-                    urls.append(img_url + "\n", style="underline")
-                renderables.append(
-                    Panel(
-                        urls,
-                        title="Images",
-                        border_style="#9fe870",
-                        box=box.SQUARE,
-                        padding=(0, 1),
-                    )
-                )
+        article_body = [Rule(style="#9fe870"), Markdown(text)]
 
-        renderables.append(Rule(style="#9fe870"))
-        renderables.append(Markdown(text))
-        self.body.update(Group(*renderables))  # type: ignore[union-attr]
+        if content.images and _kitty_images_enabled() and _is_kitty_terminal():
+            # Show the text right away; image downloads shouldn't hold it back.
+            self.body.update(Group(header_panel, *article_body))  # type: ignore[union-attr]
+            # Fetch (concurrently) and render up to 2 images inline via Kitty protocol.
+            results = await asyncio.gather(
+                *(_fetch_image_bytes(img_url) for img_url in content.images[:2]),
+                return_exceptions=True,
+            )
+            images = []
+            for data in results:
+                if isinstance(data, BaseException):
+                    continue
+                cols, rows = _image_cell_size(self.app.size.width if hasattr(self.app, "size") else 80)
+                images.append(KittyImageRenderable(data, cols=cols, rows=rows))
+            if images:
+                images_panel = _images_panel(Group(*images))
+            else:
+                # Fallback to URLs if we couldn't render.
+                images_panel = _image_urls_panel(content.images)
+            self.body.update(Group(header_panel, images_panel, *article_body))  # type: ignore[union-attr]
+        elif content.images:
+            self.body.update(Group(header_panel, _image_urls_panel(content.images), *article_body))  # type: ignore[union-attr]
+        else:
+            self.body.update(Group(header_panel, *article_body))  # type: ignore[union-attr]
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=False)
@@ -271,12 +322,14 @@ class ArticleReader(ModalScreen):
         self.scroll.styles.height = "1fr"
         self.scroll.styles.padding = (1, 2)
         try:
-            content = await fetch_article_text(self.article.link)
+            content = await fetch_article_text(self.article.link, content_html=self.article.content_html)
             await self._render_article(content)
         except Exception as e:
             if isinstance(e, httpx.HTTPStatusError) and e.response.status_code in (403, 429):
                 if self.article.content_html:
-                    content = extract_readable_text(self.article.content_html, base_url=self.article.link)
+                    content = await asyncio.to_thread(
+                        extract_readable_text, self.article.content_html, base_url=self.article.link
+                    )
                     await self._render_article(content)
                     return
             fallback = (self.article.summary or "").strip()
@@ -314,11 +367,39 @@ class ArticleReader(ModalScreen):
             self.scroll.scroll_up()
 
 
+_SENTIMENT_TEMPLATE = "{tone.sentiment:+.2f} (pos {tone.pos:.2f} / neu {tone.neu:.2f} / neg {tone.neg:.2f})"
+_AUTHOR_LINKS_TEMPLATE = (
+    "DuckDuckGo: https://duckduckgo.com/?q={q}+journalist\n"
+    "Google: https://www.google.com/search?q={q}+journalist\n"
+    "Wikipedia: https://en.wikipedia.org/wiki/Special:Search?search={q}\n\n"
+)
+
+
+_PANEL_CACHE_MAX = 64
+
+
 class ArticleDetail(Static):
     article: Optional[Article] = reactive(None)
     show_author_links: bool = reactive(False)
 
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        # Recently rendered panels keyed by (link, show_author_links), so moving
+        # back and forth through the list doesn't rebuild them. Entries also
+        # hold the Article they were built from; a refreshed feed yields new
+        # objects and so misses.
+        self._panel_cache: OrderedDict[tuple[str, bool], tuple[Article, Panel]] = OrderedDict()
+        # Per-article values worked out once in set_article, not per render.
+        self._tone: Optional[ToneScore] = None
+        self._author_query = ""
+
     def set_article(self, article: Optional[Article]) -> None:
+        self._tone = None
+        self._author_query = ""
+        if article is not None:
+            self._tone = article.tone or analyze_tone(f"{article.title}\n{article.summary}")
+            if article.author:
+                self._author_query = article.author.replace(" ", "+")
         self.article = article
         self.show_author_links = False
         self.refresh()
@@ -332,9 +413,15 @@ class ArticleDetail(Static):
             return Text("Select an article.", style="dim")
 
         art = self.article
+        key = (art.link, self.show_author_links)
+        cached = self._panel_cache.get(key)
+        if cached is not None and cached[0] is art:
+            self._panel_cache.move_to_end(key)
+            return cached[1]
+
         published = art.published.isoformat() if art.published else "unknown"
         author = art.author or "unknown"
-        tone = analyze_tone(f"{art.title}\n{art.summary}")
+        tone = self._tone
 
         meta = Table.grid(padding=(0, 1))
         meta.add_column(style="bold #9fe870", justify="right", no_wrap=True)
@@ -352,7 +439,7 @@ class ArticleDetail(Static):
             tone_table.add_column()
             tone_table.add_row(
                 "Sentiment",
-                f"{tone.sentiment:+.2f} (pos {tone.pos:.2f} / neu {tone.neu:.2f} / neg {tone.neg:.2f})",
+                _SENTIMENT_TEMPLATE.format(tone=tone),
             )
             tone_table.add_row("Hint", tone.subjectivity_hint)
             body.extend([Rule(style="#9fe870"), Text("Tone (content-based)", style="bold"), tone_table])
@@ -361,15 +448,11 @@ class ArticleDetail(Static):
             body.extend([Rule(style="#9fe870"), Text("Summary", style="bold"), Markdown(art.summary.strip())])
 
         if self.show_author_links and art.author:
-            q = art.author.replace(" ", "+")
-            links = Text()
-            links.append(f"DuckDuckGo: https://duckduckgo.com/?q={q}+journalist\n")
-            links.append(f"Google: https://www.google.com/search?q={q}+journalist\n")
-            links.append(f"Wikipedia: https://en.wikipedia.org/wiki/Special:Search?search={q}\n\n")
+            links = Text(_AUTHOR_LINKS_TEMPLATE.format(q=self._author_query))
             links.append("Note: This app does not scrape personal profiles.", style="dim")
             body.extend([Rule(style="#9fe870"), Text("Author research links", style="bold"), links])
 
-        return Panel(
+        panel = Panel(
             Group(*body),
             title=art.title,
             title_align="left",
@@ -377,6 +460,11 @@ class ArticleDetail(Static):
             box=box.ROUNDED,
             padding=(1, 1),
         )
+        self._panel_cache[key] = (art, panel)
+        self._panel_cache.move_to_end(key)
+        if len(self._panel_cache) > _PANEL_CACHE_MAX:
+            self._panel_cache.popitem(last=False)
+        return panel
 
 class StatusBar(Horizontal):
     """Bottom bar showing Singapore weather and local time."""
@@ -384,6 +472,15 @@ class StatusBar(Horizontal):
     weather_text: str = reactive("Weather: …")
     time_text: str = reactive("Time: …")
 
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._weather_task: asyncio.Task | None = None
+        # Resolve once rather than on every clock tick.
+        try:
+            self._tz: dt.tzinfo = ZoneInfo("Asia/Singapore")
+        except ZoneInfoNotFoundError:
+            self._tz = dt.timezone(dt.timedelta(hours=8))
+
     def compose(self) -> ComposeResult:
         yield Static("", id="sb_left")
         yield Static("", id="sb_spacer")
@@ -394,10 +491,20 @@ class StatusBar(Horizontal):
         # Seed initial content so the bar isn't blank on first paint.
         self.query_one("#sb_left", Static).update(self.weather_text)
         self.query_one("#sb_right", Static).update(self.time_text)
-        self.set_interval(1.0, self._update_time)
-        self.set_interval(600.0, self._schedule_weather, pause=False)
+        # Show the last reading straight away (even across restarts) and only
+        # hit the network at startup if it's older than the refresh window.
+        cached = _cached_weather()
+        if cached is not None:
+            self.weather_text = cached[1]
+        self.set_interval(_WEATHER_TTL, self._schedule_weather, pause=False)
         self._update_time()
-        self.call_after_refresh(self._schedule_weather)
+        if cached is None or time.time() - cached[0] >= _WEATHER_TTL:
+            self.call_after_refresh(self._schedule_weather)
+
+    async def on_unmount(self) -> None:
+        # Widgets unmount before the app closes the shared client; make sure no
+        # fetch is left running to reopen it.
+        await _cancel_task(self._weather_task)
 
     def watch_weather_text(self, value: str) -> None:
         self.query_one("#sb_left", Static).update(value)
@@ -406,50 +513,95 @@ class StatusBar(Horizontal):
         self.query_one("#sb_right", Static).update(value)
 
     def _update_time(self) -> None:
-        try:
-            tz = ZoneInfo("Asia/Singapore")
-        except ZoneInfoNotFoundError:
-            tz = dt.timezone(dt.timedelta(hours=8))
-        now = dt.datetime.now(tz)
-        self.time_text = f"{now:%a %d %b %H:%M:%S} SGT"
+        now = dt.datetime.now(self._tz)
+        self.time_text = f"{now:%a %d %b %H:%M} SGT"
+        # Minute resolution is enough for a news reader; wake up just after the
+        # next minute boundary instead of repainting every second.
+        delay = 60.0 - now.second - now.microsecond / 1_000_000
+        self.set_timer(delay + 0.05, self._update_time)
 
     def _schedule_weather(self) -> None:
-        asyncio.create_task(self._refresh_weather())
+        # Don't stack fetches behind a slow network; let the in-flight one finish.
+        if self._weather_task is not None and not self._weather_task.done():
+            return
+        self._weather_task = asyncio.create_task(self._refresh_weather())
 
     async def _refresh_weather(self) -> None:
-        # Open-Meteo current weather for Singapore (no API key).
-        url = (
-            "https://api.open-meteo.com/v1/forecast"
-            "?latitude=1.3521&longitude=103.8198"
-            "&current=temperature_2m,relative_humidity_2m,weather_code,wind_speed_10m"
-            "&timezone=Asia%2FSingapore"
-        )
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                resp = await client.get(url)
-                resp.raise_for_status()
-                data = resp.json()
-            current = data.get("current") or {}
-            temp = current.get("temperature_2m")
-            hum = current.get("relative_humidity_2m")
-            code = current.get("weather_code")
-            wind = current.get("wind_speed_10m")
-            desc = _WEATHER_CODES.get(int(code), "Unknown") if code is not None else "Unknown"
-            parts = []
-            if temp is not None:
-                parts.append(f"{temp:.0f}°C")
-            if hum is not None:
-                parts.append(f"{hum:.0f}% RH")
-            if wind is not None:
-                parts.append(f"{wind:.0f} km/h")
-            detail = " · ".join(parts)
-            self.weather_text = f"SG Weather: {desc}" + (f" ({detail})" if detail else "")
+            # Hard ceiling covering DNS/connect stalls that the client timeout can miss.
+            # (wait_for rather than asyncio.timeout to stay compatible with 3.10.)
+            resp = await asyncio.wait_for(get_client().get(_WEATHER_URL, timeout=10), timeout=5.0)
+            resp.raise_for_status()
+            data = _json_loads(resp.content)
+            # Textual reactives already skip watchers when the value is equal,
+            # so an unchanged reading doesn't repaint the bar.
+            self.weather_text = _format_weather(data.get("current") or {})
+            _store_weather(self.weather_text)
         except Exception:
             # Keep last known value on failure.
             if self.weather_text == "Weather: …":
                 self.weather_text = "SG Weather: unavailable"
 
 
+# Open-Meteo current weather for Singapore (no API key).
+_WEATHER_URL = (
+    "https://api.open-meteo.com/v1/forecast"
+    "?latitude=1.3521&longitude=103.8198"
+    "&current=temperature_2m,relative_humidity_2m,weather_code,wind_speed_10m"
+    "&timezone=Asia%2FSingapore"
+)
+# Open-Meteo refreshes "current" every 15 minutes at most.
+_WEATHER_TTL = 600.0
+
+# (wall-clock timestamp, formatted text) of the last good reading. Wall clock
+# rather than monotonic so the value persisted on disk stays comparable.
+_weather_cache: tuple[float, str] | None = None
+
+
+def _weather_cache_path() -> Path:
+    return cache_dir() / "weather.json"
+
+
+def _cached_weather() -> tuple[float, str] | None:
+    global _weather_cache
+    if _weather_cache is None:
+        try:
+            raw = json.loads(_weather_cache_path().read_text(encoding="utf-8"))
+            _weather_cache = (float(raw["ts"]), str(raw["text"]))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    return _weather_cache
+
+
+def _store_weather(text: str) -> None:
+    global _weather_cache
+    _weather_cache = (time.time(), text)
+    try:
+        path = _weather_cache_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"ts": _weather_cache[0], "text": text}), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def _format_weather(current: dict) -> str:
+    temp = current.get("temperature_2m")
+    hum = current.get("relative_humidity_2m")
+    code = current.get("weather_code")
+    wind = current.get("wind_speed_10m")
+    idx = int(code) if code is not None else -1
+    desc = _WEATHER_TABLE[idx] if 0 <= idx < len(_WEATHER_TABLE) else "Unknown"
+    parts = []
+    if temp is not None:
+        parts.append(f"{temp:.0f}°C")
+    if hum is not None:
+        parts.append(f"{hum:.0f}% RH")
+    if wind is not None:
+        parts.append(f"{wind:.0f} km/h")
+    detail = " · ".join(parts)
+    return f"SG Weather: {desc}" + (f" ({detail})" if detail else "")
+
+
 _WEATHER_CODES = {
     0: "Clear",
     1: "Mostly clear",
@@ -473,6 +625,11 @@ _WEATHER_CODES = {
     96: "Thunderstorm + hail",
     99: "Severe thunderstorm + hail",
 }
+# WMO codes are small ints, so index a flat table instead of hashing.
+_WEATHER_TABLE = tuple(_WEATHER_CODES.get(i, "Unknown") for i in range(max(_WEATHER_CODES) + 1))
+
+
+_PREFETCH_CONCURRENCY = 5
 
 
 class NewsApp(App):
@@ -539,6 +696,10 @@ class NewsApp(App):
         self.current_source = None
         self.current_articles = []
         self.current_article = None
+        # Parsed articles per feed URL; filled by the startup prefetch and by
+        # load_source, bypassed on refresh.
+        self._feed_cache: dict[str, List[Article]] = {}
+        self._prefetch_task: asyncio.Task | None = None
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -550,21 +711,69 @@ class NewsApp(App):
 
     async def on_mount(self) -> None:
         if self.sources:
+            # Warm the other feeds in the background so switching is instant.
+            self._prefetch_task = asyncio.create_task(self._prefetch_feeds(self.sources[1:]))
+            self._prefetch_task.add_done_callback(self._prefetch_done)
             await self.load_source(self.sources[0])
 
-    async def load_source(self, source: Source) -> None:
+    async def on_unmount(self) -> None:
+        # Stop background work first: a prefetch still queued on the semaphore
+        # would otherwise open a fresh client after this one is closed.
+        await _cancel_task(self._prefetch_task)
+        _shutdown_tone_pool()
+        await close_client()
+
+    async def _fetch_articles(self, source: Source) -> List[Article]:
+        return await self._store_feed(source, await fetch_feed(source.url))
+
+    async def _store_feed(self, source: Source, xml: bytes) -> List[Article]:
+        articles = await _with_tones(await parse_feed_async(xml, source.name))
+        self._feed_cache[source.url] = articles
+        return articles
+
+    def _prefetch_done(self, task: asyncio.Task) -> None:
+        # Retrieve the exception so a failed prefetch shows up in the log
+        # rather than as "Task exception was never retrieved" at exit.
+        if not task.cancelled() and task.exception() is not None:
+            self.log.error("Feed prefetch failed", task.exception())
+
+    async def _prefetch_feeds(self, sources: List[Source]) -> None:
+        # Bound concurrency so feeds sharing a host (or proxy) aren't throttled.
+        sem = asyncio.Semaphore(_PREFETCH_CONCURRENCY)
+
+        async def prefetch(source: Source) -> None:
+            async with sem:
+                try:
+                    xml = await fetch_feed(source.url)
+                except Exception:
+                    # Ignored here; load_source retries and reports it.
+                    return
+            # Store each feed as it arrives so a stalled source can't hold back the rest.
+            if source.url in self._feed_cache:
+                return
+            try:
+                await self._store_feed(source, xml)
+            except Exception as e:
+                self.log.error(f"Prefetch of {source.name} failed", e)
+
+        await asyncio.gather(*(prefetch(source) for source in sources))
+
+    async def load_source(self, source: Source, refresh: bool = False) -> None:
         self.current_source = source
         detail = self.query_one(ArticleDetail)
         detail.set_article(None)
         articles_view = self.query_one(ArticlesList)
         articles_view.set_articles([])
         self.title = f"newscli — {source.name}"
-        try:
-            xml = await fetch_feed(source.url)
-            articles = parse_feed(xml, source.name)
-        except Exception as e:
-            articles = []
-            detail.update(f"Failed to load feed: {e}")
+        cached = None if refresh else self._feed_cache.get(source.url)
+        if cached is not None:
+            articles = cached
+        else:
+            try:
+                articles = await self._fetch_articles(source)
+            except Exception as e:
+                articles = []
+                detail.update(f"Failed to load feed: {e}")
 
         self.current_articles = articles
         articles_view.set_articles(articles)
@@ -581,7 +790,7 @@ class NewsApp(App):
 
     async def action_refresh(self) -> None:
         if self.current_source:
-            await self.load_source(self.current_source)
+            await self.load_source(self.current_source, refresh=True)
 
     def action_open_link(self) -> None:
         if self.current_article:
@@ -598,5 +807,17 @@ class NewsApp(App):
         self.push_screen(ArticleReader(article))
 
 
+def _install_uvloop() -> None:
+    """Use uvloop's faster event loop when the optional extra is installed."""
+    if os.name == "nt":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
+
+
 def run() -> None:
+    _install_uvloop()
     NewsApp().run()
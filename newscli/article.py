@@ -1,14 +1,28 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import os
 import re
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Optional
 
 import httpx
-from bs4 import BeautifulSoup, Comment
+from bs4 import BeautifulSoup, CData, FeatureNotFound, NavigableString, Tag
 from urllib.parse import urlparse, urljoin
 
+from .http_cache import cached_get
+from .net import get_client
+
+try:
+    # Optional (``fast`` extra). Only used where it measured faster than re.
+    import re2
+except ImportError:
+    re2 = None
+
 
 DEFAULT_HEADERS = {
     # A common desktop UA to avoid simple bot blocks.
@@ -57,7 +71,7 @@ class ArticleContent:
     images: list[str] = field(default_factory=list)
 
 
-async def fetch_html(url: str) -> str:
+async def fetch_html(url: str, client: httpx.AsyncClient | None = None) -> str:
     parsed = urlparse(url)
     headers = dict(DEFAULT_HEADERS)
     # Some SG outlets require a plausible referer.
@@ -66,55 +80,84 @@ async def fetch_html(url: str) -> str:
     elif parsed.netloc.endswith("straitstimes.com"):
         headers["Referer"] = "https://www.straitstimes.com/"
 
-    async with httpx.AsyncClient(follow_redirects=True, timeout=20) as client:
-        try:
-            resp = await client.get(url, headers=headers)
-            resp.raise_for_status()
-            ctype = (resp.headers.get("content-type") or "").lower()
-            text = resp.text
-            if "text/html" not in ctype and "application/xhtml+xml" not in ctype:
-                # If not HTML-ish, still allow if it looks like markup.
-                if not text.lstrip().startswith("<"):
-                    raise ValueError(f"Non-HTML content-type: {ctype}")
-            return text
-        except httpx.ReadTimeout:
-            # One quick retry on timeouts.
-            resp_retry = await client.get(url, headers=headers)
-            resp_retry.raise_for_status()
-            return resp_retry.text
-        except httpx.HTTPStatusError as e:
-            # Retry once with a slightly different UA on 403/429.
-            status = e.response.status_code
-            if status in (403, 429):
-                retry_headers = dict(headers)
-                retry_headers["User-Agent"] = (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                )
-                resp2 = await client.get(url, headers=retry_headers)
-                try:
-                    resp2.raise_for_status()
-                    return resp2.text
-                except httpx.HTTPStatusError as e2:
-                    # Mothership blocks bot fetches; use an explicit mirror fallback.
-                    if parsed.netloc.endswith("mothership.sg") and e2.response.status_code in (403, 429):
-                        mirror_resp = await client.get(_mirror_url(url), headers=_mirror_headers())
-                        mirror_resp.raise_for_status()
-                        return mirror_resp.text
-                    # Optional global mirror fallback for other sites.
-                    if mirror_on_block_enabled() and e2.response.status_code in (403, 429):
-                        mirror_resp = await client.get(_mirror_url(url), headers=_mirror_headers())
-                        mirror_resp.raise_for_status()
-                        return mirror_resp.text
-                    raise
-            raise
+    client = client or get_client()
+    try:
+        # Revalidates against any copy on disk, so re-opening is a cheap 304.
+        resp = await cached_get(client, url, headers)
+        resp.raise_for_status()
+        ctype = (resp.headers.get("content-type") or "").lower()
+        text = resp.text
+        if "text/html" not in ctype and "application/xhtml+xml" not in ctype:
+            # If not HTML-ish, still allow if it looks like markup.
+            if not text.lstrip().startswith("<"):
+                raise ValueError(f"Non-HTML content-type: {ctype}")
+        return text
+    except httpx.ReadTimeout:
+        # One quick retry on timeouts.
+        resp_retry = await client.get(url, headers=headers)
+        resp_retry.raise_for_status()
+        return resp_retry.text
+    except httpx.HTTPStatusError as e:
+        # Retry once with a slightly different UA on 403/429.
+        status = e.response.status_code
+        if status in (403, 429):
+            retry_headers = dict(headers)
+            retry_headers["User-Agent"] = (
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) "
+                "Chrome/120.0.0.0 Safari/537.36"
+            )
+            resp2 = await client.get(url, headers=retry_headers)
+            try:
+                resp2.raise_for_status()
+                return resp2.text
+            except httpx.HTTPStatusError as e2:
+                # Mothership blocks bot fetches; use an explicit mirror fallback.
+                if parsed.netloc.endswith("mothership.sg") and e2.response.status_code in (403, 429):
+                    mirror_resp = await client.get(_mirror_url(url), headers=_mirror_headers())
+                    mirror_resp.raise_for_status()
+                    return mirror_resp.text
+                # Optional global mirror fallback for other sites.
+                if mirror_on_block_enabled() and e2.response.status_code in (403, 429):
+                    mirror_resp = await client.get(_mirror_url(url), headers=_mirror_headers())
+                    mirror_resp.raise_for_status()
+                    return mirror_resp.text
+                raise
+        raise
 
 
 def _clean_text(text: str) -> str:
-    text = re.sub(r"[ \t]+\n", "\n", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    return text.strip()
+    # Strip trailing spaces/tabs per line and keep at most one blank line in a
+    # row. Plain string methods beat a regex that would try every space.
+    lines: list[str] = []
+    blank = False
+    for ln in text.split("\n"):
+        ln = ln.rstrip(" \t")
+        if ln:
+            blank = False
+        elif blank:
+            continue
+        else:
+            blank = True
+        lines.append(ln)
+    return "\n".join(lines).strip()
+
+
+# Publisher boilerplate, matched per line by _cleanup_domain_text.
+_ST_SIGNUP_RE = re.compile(r"sign up now", re.I)
+_ST_DATELINE_RE = re.compile(r"(published|updated)\s+[A-Za-z]{3}\s+\d{1,2},\s+\d{4}", re.I)
+_ST_PHOTO_CREDIT_RE = re.compile(r"(st\s*)?photo\s*:", re.I)
+_CNA_AUDIO_RE = re.compile(r"audio is generated by an ai tool", re.I)
+_MS_ADVERT_RE = re.compile(r"advertisement", re.I)
+_MS_SITE_SUFFIX_RE = re.compile(r"-\s*mothership\.sg", re.I)
+_MS_CLOSE_LINK_RE = re.compile(r"^\[\s*✕\s*\]\(|^\[\s*\]\(.*#close\)")
+_MS_SITE_LINK_RE = re.compile(
+    r"(mothership\.sg/category/|mothership\.sg/assets/|mothership\.sg/careers|uid\.mediacorp\.sg/api/mepixel\.gif)",
+    re.I,
+)
+_MS_CATEGORY_ITEM_RE = re.compile(r"^\*\s*\[.*\]\(https?://mothership\.sg/category/", re.I)
+_MS_IMAGE_ITEM_RE = re.compile(r"^\*\s*\[image\s+\d+:", re.I)
+_MS_SOCIAL_RE = re.compile(r"(telegram|whatsapp|facebook|twitter)", re.I)
 
 
 def _cleanup_domain_text(text: str, base_url: str | None) -> str:
@@ -130,21 +173,17 @@ def _cleanup_domain_text(text: str, base_url: str | None) -> str:
         for idx, ln in enumerate(lines):
             s = ln.strip()
             if idx < 10:
-                if re.match(r"sign up now", s, re.I):
+                if _ST_SIGNUP_RE.match(s):
                     continue
-                if re.match(
-                    r"(published|updated)\s+[A-Za-z]{3}\s+\d{1,2},\s+\d{4}",
-                    s,
-                    re.I,
-                ):
+                if _ST_DATELINE_RE.match(s):
                     continue
-                if re.match(r"(st\s*)?photo\s*:", s, re.I):
+                if _ST_PHOTO_CREDIT_RE.match(s):
                     continue
             cleaned.append(ln)
         lines = cleaned
 
     elif host.endswith("channelnewsasia.com") or host.endswith("cna.com.sg"):
-        lines = [ln for ln in lines if not re.search(r"audio is generated by an ai tool", ln, re.I)]
+        lines = [ln for ln in lines if not _CNA_AUDIO_RE.search(ln)]
 
     elif host.endswith("mothership.sg"):
         cleaned = []
@@ -154,7 +193,7 @@ def _cleanup_domain_text(text: str, base_url: str | None) -> str:
             if not s:
                 cleaned.append(ln)
                 continue
-            if re.fullmatch(r"advertisement", s, re.I):
+            if _MS_ADVERT_RE.fullmatch(s):
                 prev_ad = True
                 continue
             if prev_ad and set(s) <= {"-"} and len(s) <= 20:
@@ -164,23 +203,17 @@ def _cleanup_domain_text(text: str, base_url: str | None) -> str:
             if s.strip("=").strip() == "" and len(s) <= 20:
                 # Markdown underline / separators.
                 continue
-            if idx < 3 and re.search(r"-\s*mothership\.sg", s, re.I):
+            if idx < 3 and _MS_SITE_SUFFIX_RE.search(s):
                 continue
             if _SKIP_IMAGE_RE.search(s):
                 continue
-            if re.match(r"^\[\s*✕\s*\]\(", s) or re.match(r"^\[\s*\]\(.*#close\)", s):
+            if _MS_CLOSE_LINK_RE.match(s):
                 continue
-            if re.search(
-                r"(mothership\.sg/category/|mothership\.sg/assets/|mothership\.sg/careers|uid\.mediacorp\.sg/api/mepixel\.gif)",
-                s,
-                re.I,
-            ):
+            if _MS_SITE_LINK_RE.search(s):
                 continue
-            if re.match(r"^\*\s*\[.*\]\(https?://mothership\.sg/category/", s, re.I):
+            if _MS_CATEGORY_ITEM_RE.match(s):
                 continue
-            if re.match(r"^\*\s*\[image\s+\d+:", s, re.I) and re.search(
-                r"(telegram|whatsapp|facebook|twitter)", s, re.I
-            ):
+            if _MS_IMAGE_ITEM_RE.match(s) and _MS_SOCIAL_RE.search(s):
                 continue
             cleaned.append(ln)
         lines = cleaned
@@ -188,92 +221,155 @@ def _cleanup_domain_text(text: str, base_url: str | None) -> str:
     return _clean_text("\n".join(lines))
 
 
-def _link_density(node) -> float:
-    text = node.get_text(" ", strip=True) or ""
-    if not text:
-        return 1.0
-    link_text = " ".join(a.get_text(" ", strip=True) for a in node.find_all("a"))
-    return min(1.0, len(link_text) / max(1, len(text)))
+_POSITIVE_RE = re.compile(r"(article|content|post|entry|story|main|body|text)", re.I)
+_NEGATIVE_RE = re.compile(
+    r"(comment|nav|footer|header|sidebar|menu|advert|promo|related|share|cookie|social|subscribe)",
+    re.I,
+)
+_CONTAINER_TAGS = frozenset({"article", "main", "section", "div"})
+# The string types get_text() collects for ordinary tags (no comments etc.).
+_TEXT_TYPES = (NavigableString, CData)
 
 
-def _candidate_score(node) -> float:
+def _candidate_score(node, para_text_len: int, long_paras: int, text_len: int, link_text_len: int) -> float:
     # Score based on paragraph mass, penalize navigation/links.
-    tag_name = getattr(node, "name", "") or ""
-    classes = " ".join(node.get("class", []) or [])
-    node_id = node.get("id", "") or ""
-    ident = f"{classes} {node_id}".lower()
-
-    positive_re = re.compile(r"(article|content|post|entry|story|main|body|text)", re.I)
-    negative_re = re.compile(
-        r"(comment|nav|footer|header|sidebar|menu|advert|promo|related|share|cookie|social|subscribe)",
-        re.I,
-    )
-
-    paragraphs = node.find_all("p")
-    long_paras = [p for p in paragraphs if len(p.get_text(" ", strip=True)) >= 40]
-    para_text_len = sum(len(p.get_text(" ", strip=True)) for p in paragraphs)
+    tag_name = node.name or ""
+    # Check the id and each class token directly; the patterns are
+    # case-insensitive and never span a space, so no joined string is needed.
+    classes = node.get("class") or ()
+    node_id = node.get("id") or ""
 
-    score = para_text_len / 100.0 + len(long_paras) * 2.0
+    score = para_text_len / 100.0 + long_paras * 2.0
     if tag_name in ("article", "main"):
         score += 10.0
-    if positive_re.search(ident):
+    if _POSITIVE_RE.search(node_id) or any(_POSITIVE_RE.search(c) for c in classes):
         score += 6.0
-    if negative_re.search(ident):
+    if _NEGATIVE_RE.search(node_id) or any(_NEGATIVE_RE.search(c) for c in classes):
         score -= 8.0
 
-    ld = _link_density(node)
+    # Link density: share of the node's text that sits inside <a> tags.
+    ld = min(1.0, link_text_len / max(1, text_len)) if text_len else 1.0
     score *= max(0.1, 1.0 - ld)
     return score
 
 
+def _score_tree(root) -> tuple[dict[int, float], Optional[Tag]]:
+    """Score every article/main/section/div under ``root`` in one post-order walk.
+
+    Each node's text, paragraph and link totals are summed from its children,
+    so no subtree is traversed more than once. Lengths match what
+    ``get_text(" ", strip=True)`` would give for the same node. Returns
+    scores keyed by ``id(node)``, plus the top-scoring node (the first in
+    document order on ties). Nodes that provably cannot beat a node already
+    scored are left out. ``root`` itself is always scored.
+    """
+    scores: dict[int, float] = {}
+    best = float("-inf")
+    best_node: Optional[Tag] = None
+    best_order = 0
+
+    # An explicit stack rather than recursion: lxml happily builds trees nested
+    # deeper than Python's recursion limit. Each frame holds the node, its
+    # pending children, its running totals and its document-order position:
+    # [text_len, text_count, para_text_len, long_paras, link_text_len, link_count]
+    order = 0
+    stack = [(root, iter(root.children), [0, 0, 0, 0, 0, 0], order)]
+    while stack:
+        node, children, acc, node_order = stack[-1]
+        for child in children:
+            if isinstance(child, Tag):
+                order += 1
+                stack.append((child, iter(child.children), [0, 0, 0, 0, 0, 0], order))
+                break
+            if type(child) in _TEXT_TYPES:
+                stripped = child.strip()
+                if stripped:
+                    acc[0] += len(stripped)
+                    acc[1] += 1
+        else:
+            # All children done: finish this node and fold it into its parent.
+            stack.pop()
+            text_len, text_n, para_len, long_paras, link_len, link_n = acc
+            # Length of the " "-joined text of this node.
+            own_len = text_len + text_n - 1 if text_n else 0
+            if node.name == "p":
+                para_len += own_len
+                long_paras += own_len >= 40
+            elif node.name == "a":
+                link_len += own_len
+                link_n += 1
+            if node.name in _CONTAINER_TAGS:
+                # Upper bound on the score: paragraph mass plus every bonus, with no
+                # link penalty. Most sidebar/wrapper divs fall below the best node
+                # so far here, which skips the class regexes and link density.
+                bound = para_len / 100.0 + long_paras * 2.0 + (16.0 if node.name in ("article", "main") else 6.0)
+                if bound >= best or node is root:
+                    # Link texts are joined with " " too.
+                    joined_link_len = link_len + link_n - 1 if link_n else 0
+                    score = _candidate_score(node, para_len, long_paras, own_len, joined_link_len)
+                    scores[id(node)] = score
+                    # Post-order reaches a parent after its children, so ties
+                    # are settled by position rather than by visit order.
+                    if score > best or (score == best and node_order < best_order):
+                        best, best_node, best_order = score, node, node_order
+            if stack:
+                parent = stack[-1][2]
+                parent[0] += text_len
+                parent[1] += text_n
+                parent[2] += para_len
+                parent[3] += long_paras
+                parent[4] += link_len
+                parent[5] += link_n
+    return scores, best_node
+
+
 def _best_container(soup: BeautifulSoup):
     # Prefer semantic containers if they look substantial.
     semantic = soup.find("article") or soup.find("main")
-    if semantic and _candidate_score(semantic) >= 5:
+    if semantic and _score_tree(semantic)[0][id(semantic)] >= 5:
         return semantic
 
-    candidates = []
-    for tag in soup.find_all(["article", "main", "section", "div"]):
-        try:
-            candidates.append((tag, _candidate_score(tag)))
-        except Exception:
-            continue
-    if not candidates:
+    scores, best = _score_tree(soup)
+    if best is None:
         return soup.body or soup
-    candidates.sort(key=lambda t: t[1], reverse=True)
-    best, best_score = candidates[0]
-    return best if best_score >= 3 else (soup.body or soup)
+    return best if scores[id(best)] >= 3 else (soup.body or soup)
 
 
-_IMAGE_EXT_RE = re.compile(r"\.(jpe?g|png|gif|webp|bmp|tiff)(\?|#|$)", re.I)
 _SKIP_IMAGE_RE = re.compile(
     r"(telegram-button|wa-button|whatsapp-button|facebook-button|twitter-button|share-button)",
     re.I,
 )
+_WHITESPACE_RE = re.compile(r"\s")
+_SVG_ICO_RE = re.compile(r"\.(svg|ico)(\?|#|$)", re.I)
+# A whole URL token from plain text, kept only if it has an image extension
+# that ends the path (a query or fragment may follow).
+_IMAGE_URL_RE = re.compile(
+    r"https?://[^\s)]*?\.(?:jpe?g|png|gif|webp|bmp|tiff)(?:[?#][^\s)]*)?(?=[\s)]|$)",
+    re.I,
+)
+_OG_IMAGE_PROPS = frozenset(("og:image", "og:image:url", "og:image:secure_url"))
+_TWITTER_IMAGE_NAMES = frozenset(("twitter:image", "twitter:image:src"))
+_IMAGE_SRC_REL_RE = re.compile(r"image_src", re.I)
 
 
 def _dedupe(urls: list[str]) -> list[str]:
-    seen: set[str] = set()
-    out: list[str] = []
-    for url in urls:
-        if url in seen:
-            continue
-        seen.add(url)
-        out.append(url)
-    return out
+    # dict keeps first-seen order.
+    return list(dict.fromkeys(urls))
 
 
 def _normalize_image_url(raw_url: str, base_url: str | None) -> Optional[str]:
     url = (raw_url or "").strip()
-    if not url or url.startswith("data:") or re.search(r"\s", url):
+    if not url or url.startswith("data:") or _WHITESPACE_RE.search(url):
         return None
     if url.startswith("//"):
         url = "https:" + url
     if _SKIP_IMAGE_RE.search(url):
         return None
-    if re.search(r"\.(svg|ico)(\?|#|$)", url, re.I):
+    if _SVG_ICO_RE.search(url):
         return None
-    if base_url:
+    # Most candidates are already absolute; only resolve the rest, which
+    # saves urljoin re-parsing base_url for every image on the page.
+    if base_url and not url.startswith(("https://", "http://")):
         url = urljoin(base_url, url)
     return url
 
@@ -311,9 +407,9 @@ def _is_small_image(img) -> bool:
 
 def _extract_images_from_plain_text(text: str) -> list[str]:
     urls: list[str] = []
-    for match in re.findall(r"https?://[^\s)]+", text):
+    for match in _IMAGE_URL_RE.findall(text):
         norm = _normalize_image_url(match, None)
-        if norm and _IMAGE_EXT_RE.search(norm):
+        if norm:
             urls.append(norm)
     return _dedupe(urls)[:5]
 
@@ -321,34 +417,36 @@ def _extract_images_from_plain_text(text: str) -> list[str]:
 def _extract_images_from_html(
     soup: BeautifulSoup, container: BeautifulSoup, base_url: str | None
 ) -> list[str]:
-    urls: list[str] = []
+    # Insertion-ordered set; re-adding a URL keeps its first position.
+    urls: dict[str, None] = {}
 
     def add(raw: str) -> None:
         norm = _normalize_image_url(raw, base_url)
-        if norm and norm not in urls:
-            urls.append(norm)
-
-    # OG / Twitter images are usually the cover.
-    for meta in soup.find_all("meta", property=re.compile(r"^og:image", re.I)):
-        prop = (meta.get("property") or "").lower()
-        if prop not in {"og:image", "og:image:url", "og:image:secure_url"}:
-            continue
+        if norm:
+            urls[norm] = None
+
+    # OG / Twitter images are usually the cover. One pass over the meta tags;
+    # OG images still go first.
+    og_images: list[str] = []
+    twitter_images: list[str] = []
+    for meta in soup.find_all("meta"):
         content = meta.get("content")
-        if content:
-            add(content)
-    for meta in soup.find_all("meta", attrs={"name": re.compile(r"^twitter:image", re.I)}):
-        name = (meta.get("name") or "").lower()
-        if name not in {"twitter:image", "twitter:image:src"}:
+        if not content:
             continue
-        content = meta.get("content")
-        if content:
-            add(content)
-    link_src = soup.find("link", rel=re.compile(r"image_src", re.I))
+        if (meta.get("property") or "").lower() in _OG_IMAGE_PROPS:
+            og_images.append(content)
+        if (meta.get("name") or "").lower() in _TWITTER_IMAGE_NAMES:
+            twitter_images.append(content)
+    for content in og_images + twitter_images:
+        add(content)
+    link_src = soup.find("link", rel=_IMAGE_SRC_REL_RE)
     if link_src and link_src.get("href"):
         add(link_src["href"])
 
     # Inline images inside main container.
     for img in container.find_all("img"):
+        if len(urls) >= 5:
+            break
         if _is_small_image(img):
             continue
         src = _pick_img_source(img)
@@ -356,12 +454,59 @@ def _extract_images_from_html(
             continue
         add(src)
 
-    return urls[:5]
+    return list(urls)[:5]
+
+
+# Runs over the whole non-ASCII page, where RE2's linear scan beats re.
+_CONTROL_BYTES_RE = (re2 or re).compile(r"[\x00-\x08\x0b-\x0c\x0e-\x1f]")
+# Same set as a translate() table: much faster on pure-ASCII pages, but slower
+# than the regex once the str holds wider characters.
+_CONTROL_BYTES_DEL = dict.fromkeys([*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20)])
+_TITLE_LINE_RE = re.compile(r"^\s*title\s*:\s*(.+)$", re.I)
+_MIRROR_META_RE = re.compile(r"^\s*(url source|published time|markdown content)\s*:", re.I)
+_BYLINE_CLASS_RE = re.compile(r"(byline|author|writer)", re.I)
+
+
+# Dropped before scoring. This can't be a SoupStrainer: parse_only only
+# filters at the top level, so it would keep a <nav> nested in <article> yet
+# hoist a <div> out of a <footer>, detached from what made it boilerplate.
+_BOILERPLATE_TAGS = ("script", "style", "noscript", "header", "footer", "nav", "aside", "form", "iframe")
+
+# Elements whose text becomes a paragraph of the extracted article; headings
+# are kept even when short.
+_BLOCK_TAGS = frozenset(("p", "h2", "h3", "li", "blockquote"))
+_HEADING_TAGS = frozenset(("h2", "h3"))
+
+
+# Extraction results by (content digest, base_url). A page that comes back
+# unchanged (an HTTP 304, or the feed's own content_html) skips the parse.
+# Extraction runs on worker threads, hence the lock.
+_EXTRACT_MEMO_MAX = 64
+_extract_memo: OrderedDict[tuple[bytes, str | None], ArticleContent] = OrderedDict()
+_extract_memo_lock = threading.Lock()
 
 
 def extract_readable_text(html: str, base_url: str | None = None) -> ArticleContent:
+    key = (hashlib.blake2b(html.encode("utf-8", "surrogatepass"), digest_size=16).digest(), base_url)
+    with _extract_memo_lock:
+        hit = _extract_memo.get(key)
+        if hit is not None:
+            _extract_memo.move_to_end(key)
+            return hit
+    content = _extract_readable_text(html, base_url)
+    with _extract_memo_lock:
+        _extract_memo[key] = content
+        while len(_extract_memo) > _EXTRACT_MEMO_MAX:
+            _extract_memo.popitem(last=False)
+    return content
+
+
+def _extract_readable_text(html: str, base_url: str | None) -> ArticleContent:
     # Some mirrors / sites may return odd control bytes; sanitize before parsing.
-    sanitized = re.sub(r"[\x00-\x08\x0b-\x0c\x0e-\x1f]", "", html)
+    if html.isascii():
+        sanitized = html.translate(_CONTROL_BYTES_DEL)
+    else:
+        sanitized = _CONTROL_BYTES_RE.sub("", html)
     # If it doesn't look like HTML, treat as plain text.
     if "<" not in sanitized and ">" not in sanitized:
         lines = [ln.rstrip() for ln in sanitized.splitlines()]
@@ -369,7 +514,7 @@ def extract_readable_text(html: str, base_url: str | None = None) -> ArticleCont
         byline = None
         # Mirrors (e.g., r.jina.ai) often prefix plain text with metadata.
         for idx, ln in enumerate(lines[:8]):
-            m = re.match(r"^\s*title\s*:\s*(.+)$", ln, re.I)
+            m = _TITLE_LINE_RE.match(ln)
             if m:
                 maybe_title = m.group(1).strip()
                 if maybe_title:
@@ -379,7 +524,7 @@ def extract_readable_text(html: str, base_url: str | None = None) -> ArticleCont
 
         filtered: list[str] = []
         for ln in lines:
-            if re.match(r"^\s*(url source|published time|markdown content)\s*:", ln, re.I):
+            if _MIRROR_META_RE.match(ln):
                 continue
             filtered.append(ln)
         filtered_text = "\n".join(filtered)
@@ -388,22 +533,25 @@ def extract_readable_text(html: str, base_url: str | None = None) -> ArticleCont
         images = _extract_images_from_plain_text(filtered_text)
         return ArticleContent(title=title, byline=byline, text=text, images=images)
 
-    soup = BeautifulSoup(sanitized, "html.parser")
-
-    # Remove comments and obvious boilerplate.
-    for c in soup.find_all(string=lambda s: isinstance(s, Comment)):
-        c.extract()
-    for tag in soup(["script", "style", "noscript", "header", "footer", "nav", "aside", "form", "iframe"]):
+    try:
+        soup = BeautifulSoup(sanitized, "lxml")
+    except FeatureNotFound:
+        # lxml is a declared dependency, but keep working without it.
+        soup = BeautifulSoup(sanitized, "html.parser")
+
+    # Remove obvious boilerplate. Comments need no sweep of their own:
+    # get_text() and the container scorer only collect plain text nodes.
+    for tag in soup(_BOILERPLATE_TAGS):
         tag.decompose()
 
-    # Title heuristics: prefer OG title, then h1, then <title>.
-    title = ""
-    og_title = soup.find("meta", property="og:title") or soup.find("meta", attrs={"name": "og:title"})
-    if og_title and og_title.get("content"):
-        title = og_title["content"].strip()
+    # Title heuristics: prefer h1, then OG title, then <title>. The OG lookups
+    # are skipped when the page has a usable h1, as it always wins.
     h1 = soup.find("h1")
-    if h1 and h1.get_text(strip=True):
-        title = h1.get_text(strip=True)
+    title = h1.get_text(strip=True) if h1 else ""
+    if not title:
+        og_title = soup.find("meta", property="og:title") or soup.find("meta", attrs={"name": "og:title"})
+        if og_title and og_title.get("content"):
+            title = og_title["content"].strip()
     if not title and soup.title and soup.title.string:
         title = soup.title.string.strip()
 
@@ -412,20 +560,22 @@ def extract_readable_text(html: str, base_url: str | None = None) -> ArticleCont
 
     # Byline heuristics: search near top of container.
     byline = None
-    by = container.find(attrs={"class": re.compile(r"(byline|author|writer)", re.I)})
+    by = container.find(attrs={"class": _BYLINE_CLASS_RE})
     if not by:
-        by = soup.find(attrs={"class": re.compile(r"(byline|author|writer)", re.I)})
+        by = soup.find(attrs={"class": _BYLINE_CLASS_RE})
     if by:
         byline_text = by.get_text(" ", strip=True)
         byline = byline_text or None
 
-    # Extract meaningful blocks.
+    # Extract meaningful blocks from the container's block-level descendants.
     blocks = []
-    for el in container.find_all(["p", "h2", "h3", "li", "blockquote"]):
+    for el in container.descendants:
+        if not isinstance(el, Tag) or el.name not in _BLOCK_TAGS:
+            continue
         txt = el.get_text(" ", strip=True)
         if not txt:
             continue
-        if el.name in ("h2", "h3"):
+        if el.name in _HEADING_TAGS:
             blocks.append(txt)
             continue
         if len(txt) < 20:
@@ -450,6 +600,33 @@ def extract_readable_text(html: str, base_url: str | None = None) -> ArticleCont
     return ArticleContent(title=title or "(untitled)", byline=byline, text=text, images=images)
 
 
-async def fetch_article_text(url: str) -> ArticleContent:
-    html = await fetch_html(url)
-    return extract_readable_text(html, base_url=url)
+# Extracted articles by URL, oldest first, so re-opening an article skips
+# both the fetch and the parse.
+_CONTENT_CACHE_MAX = 128
+_CONTENT_CACHE_TTL = 600.0
+_content_cache: OrderedDict[str, tuple[float, ArticleContent]] = OrderedDict()
+
+
+# Feed-supplied article HTML at least this long is taken to be the full text,
+# so the page itself is never fetched.
+_FULL_TEXT_MIN_HTML = 1500
+
+
+async def fetch_article_text(
+    url: str, client: httpx.AsyncClient | None = None, content_html: str | None = None
+) -> ArticleContent:
+    if content_html and len(content_html) > _FULL_TEXT_MIN_HTML:
+        return await asyncio.to_thread(extract_readable_text, content_html, base_url=url)
+    # Only touched from the event loop thread, so no lock is needed.
+    hit = _content_cache.get(url)
+    if hit is not None and time.monotonic() - hit[0] < _CONTENT_CACHE_TTL:
+        _content_cache.move_to_end(url)
+        return hit[1]
+    html = await fetch_html(url, client=client)
+    # Parsing a large page takes long enough to stall the UI; keep it off the loop.
+    content = await asyncio.to_thread(extract_readable_text, html, base_url=url)
+    _content_cache[url] = (time.monotonic(), content)
+    _content_cache.move_to_end(url)
+    while len(_content_cache) > _CONTENT_CACHE_MAX:
+        _content_cache.popitem(last=False)
+    return content
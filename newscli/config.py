@@ -28,6 +28,10 @@ def config_dir() -> Path:
     return Path.home() / ".config" / "newscli"
 
 
+def cache_dir() -> Path:
+    return Path.home() / ".cache" / "newscli"
+
+
 def load_sources() -> List[Source]:
     path = config_dir() / "sources.json"
     if not path.exists():
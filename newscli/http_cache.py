@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Mapping, Optional, Tuple
+
+import httpx
+
+from .config import cache_dir
+
+# Only what callers read back from a replayed response, plus the validators.
+_KEEP_HEADERS = ("content-type", "etag", "last-modified")
+# Entries kept on disk; the least recently used go first. Pruning trims a
+# little below the cap so it doesn't rerun on every new entry at the limit.
+_MAX_ENTRIES = 256
+
+# Entries on disk, counted once per session on the first store and then kept
+# up to date, so the directory is only listed when it is actually over the cap.
+_count_lock = threading.Lock()
+_entry_counts: dict[Path, int] = {}
+
+Entry = Tuple[dict, bytes]
+
+
+def http_cache_enabled() -> bool:
+    """On by default; set NEWSCLI_HTTP_CACHE=0 to always fetch fresh."""
+    val = os.getenv("NEWSCLI_HTTP_CACHE", "").strip().lower()
+    return val not in {"0", "false", "no", "off"}
+
+
+def _paths(url: str) -> tuple[Path, Path]:
+    key = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+    base = cache_dir() / "http"
+    return base / f"{key}.json", base / f"{key}.body"
+
+
+def _load(url: str) -> Optional[Entry]:
+    meta_path, body_path = _paths(url)
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        if meta.get("url") != url:
+            return None
+        entry = meta["headers"], body_path.read_bytes()
+        # mtime doubles as the LRU timestamp.
+        os.utime(meta_path)
+        return entry
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _prune(base: Path) -> int:
+    """Drop least recently used entries; returns how many are left."""
+    metas = list(base.glob("*.json"))
+    keep = _MAX_ENTRIES - _MAX_ENTRIES // 8
+    if len(metas) <= keep:
+        return len(metas)
+    metas.sort(key=lambda p: p.stat().st_mtime)
+    for meta_path in metas[: len(metas) - keep]:
+        meta_path.unlink(missing_ok=True)
+        meta_path.with_suffix(".body").unlink(missing_ok=True)
+    return keep
+
+
+def _note_added(base: Path) -> None:
+    with _count_lock:
+        count = _entry_counts.get(base)
+        count = sum(1 for _ in base.glob("*.json")) if count is None else count + 1
+        if count > _MAX_ENTRIES:
+            count = _prune(base)
+        _entry_counts[base] = count
+
+
+def _store(url: str, resp: httpx.Response) -> None:
+    headers = {k: resp.headers[k] for k in _KEEP_HEADERS if k in resp.headers}
+    meta_path, body_path = _paths(url)
+    try:
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        is_new = not meta_path.exists()
+        # Body first, then metadata via rename, so a reader never pairs new
+        # validators with a half-written body.
+        tmp = body_path.with_suffix(".body.tmp")
+        tmp.write_bytes(resp.content)
+        os.replace(tmp, body_path)
+        tmp = meta_path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps({"url": url, "headers": headers}), encoding="utf-8")
+        os.replace(tmp, meta_path)
+        if is_new:
+            _note_added(meta_path.parent)
+    except OSError:
+        # Read-only or full disk: just go without the cache.
+        pass
+
+
+async def cached_get(client: httpx.AsyncClient, url: str, headers: Mapping[str, str]) -> httpx.Response:
+    """GET ``url``, revalidating a previously cached copy with the origin.
+
+    A ``304 Not Modified`` is turned back into a ``200`` carrying the cached
+    body, so callers handle both cases the same way.
+    """
+    if not http_cache_enabled():
+        return await client.get(url, headers=headers)
+    # Disk reads and writes go to a worker thread, like parsing does, so a
+    # slow disk can't stall the UI.
+    cached = await asyncio.to_thread(_load, url)
+    req_headers = dict(headers)
+    if cached is not None:
+        etag = cached[0].get("etag")
+        last_modified = cached[0].get("last-modified")
+        if etag:
+            req_headers["If-None-Match"] = etag
+        if last_modified:
+            req_headers["If-Modified-Since"] = last_modified
+
+    resp = await client.get(url, headers=req_headers)
+    if resp.status_code == 304 and cached is not None:
+        return httpx.Response(200, headers=cached[0], content=cached[1], request=resp.request)
+    if resp.status_code == 200 and ("etag" in resp.headers or "last-modified" in resp.headers):
+        await asyncio.to_thread(_store, url, resp)
+    return resp
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import httpx
+
+# One pooled client for the whole app so article, image and feed fetches
+# reuse connections instead of paying a TCP/TLS handshake per request.
+_client: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            # HTTP/2 multiplexes an article and its images over one connection.
+            http2=True,
+            follow_redirects=True,
+            timeout=20,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import datetime as dt
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 
 import asyncio
 from urllib.parse import urlparse
@@ -10,6 +10,13 @@ from urllib.parse import urlparse
 import feedparser
 import httpx
 
+from .config import Source
+from .http_cache import cached_get
+from .net import get_client
+
+if TYPE_CHECKING:
+    from .analysis import ToneScore
+
 
 @dataclass(frozen=True)
 class Article:
@@ -20,9 +27,13 @@ class Article:
     summary: str
     source: str
     content_html: Optional[str] = None
+    # Filled in off the UI thread once the feed is loaded.
+    tone: Optional["ToneScore"] = None
+    # Row text for the article list, built once at parse time.
+    display_label: str = ""
 
 
-async def fetch_feed(url: str) -> str:
+async def fetch_feed(url: str, client: httpx.AsyncClient | None = None) -> bytes:
     headers = {
         "User-Agent": (
             "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
@@ -41,48 +52,69 @@ async def fetch_feed(url: str) -> str:
     elif parsed.netloc.endswith("theindependent.sg"):
         headers["Referer"] = "https://theindependent.sg/"
 
-    async with httpx.AsyncClient(follow_redirects=True, timeout=20) as client:
-        # Small retry loop for flaky feeds / simple bot blocks.
-        last_exc: Exception | None = None
-        for attempt in range(2):
-            try:
-                resp = await client.get(url, headers=headers)
-                resp.raise_for_status()
-                text = resp.text
-                ctype = (resp.headers.get("content-type") or "").lower()
-                if "text/html" in ctype or text.lstrip().startswith("<!doctype html") or text.lstrip().startswith("<html"):
-                    raise ValueError("Got HTML instead of RSS")
-                return text
-            except (httpx.ReadTimeout, httpx.ConnectError) as e:
-                last_exc = e
-                await asyncio.sleep(0.5)
-            except httpx.HTTPStatusError as e:
-                last_exc = e
-                if e.response.status_code in (403, 429) and attempt == 0:
-                    alt_headers = dict(headers)
-                    alt_headers["User-Agent"] = (
-                        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                        "AppleWebKit/537.36 (KHTML, like Gecko) "
-                        "Chrome/120.0.0.0 Safari/537.36"
-                    )
-                    resp2 = await client.get(url, headers=alt_headers)
-                    resp2.raise_for_status()
-                    return resp2.text
-                break
-
-        # Fallback: AP News via official RSS if rsshub is slow.
-        if "rsshub.app/apnews" in url:
-            official = "https://apnews.com/apf-topnews?output=rss"
-            resp3 = await client.get(official, headers=headers)
-            resp3.raise_for_status()
-            return resp3.text
-
-        assert last_exc is not None
-        raise last_exc
-
-
-def parse_feed(xml_text: str, source_name: str) -> List[Article]:
-    feed = feedparser.parse(xml_text)
+    client = client or get_client()
+    # Small retry loop for flaky feeds / simple bot blocks.
+    last_exc: Exception | None = None
+    for attempt in range(2):
+        try:
+            resp = await cached_get(client, url, headers)
+            resp.raise_for_status()
+            # Hand feedparser the raw bytes: it sniffs the XML encoding itself,
+            # so decoding here would only be undone again.
+            body = resp.content
+            ctype = (resp.headers.get("content-type") or "").lower()
+            head = body[:512].lstrip()
+            if "text/html" in ctype or head.startswith(b"<!doctype html") or head.startswith(b"<html"):
+                raise ValueError("Got HTML instead of RSS")
+            return body
+        except (httpx.ReadTimeout, httpx.ConnectError) as e:
+            last_exc = e
+            await asyncio.sleep(0.5)
+        except httpx.HTTPStatusError as e:
+            last_exc = e
+            if e.response.status_code in (403, 429) and attempt == 0:
+                alt_headers = dict(headers)
+                alt_headers["User-Agent"] = (
+                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                    "AppleWebKit/537.36 (KHTML, like Gecko) "
+                    "Chrome/120.0.0.0 Safari/537.36"
+                )
+                resp2 = await client.get(url, headers=alt_headers)
+                resp2.raise_for_status()
+                return resp2.content
+            break
+
+    # Fallback: AP News via official RSS if rsshub is slow.
+    if "rsshub.app/apnews" in url:
+        official = "https://apnews.com/apf-topnews?output=rss"
+        resp3 = await client.get(official, headers=headers)
+        resp3.raise_for_status()
+        return resp3.content
+
+    assert last_exc is not None
+    raise last_exc
+
+
+async def fetch_all_feeds(
+    sources: List[Source], concurrency: int = 8, client: httpx.AsyncClient | None = None
+) -> List[Tuple[Source, Union[bytes, BaseException]]]:
+    """Fetch several feeds concurrently, with at most ``concurrency`` in flight.
+
+    Results come back in ``sources`` order; a feed that failed carries its
+    exception in place of the feed body instead of aborting the rest.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def fetch(src: Source) -> bytes:
+        async with sem:
+            return await fetch_feed(src.url, client=client)
+
+    results = await asyncio.gather(*[fetch(src) for src in sources], return_exceptions=True)
+    return list(zip(sources, results))
+
+
+def parse_feed(xml: bytes, source_name: str) -> List[Article]:
+    feed = feedparser.parse(xml)
     articles: List[Article] = []
     for entry in feed.entries[:200]:
         title = str(entry.get("title", "")).strip() or "(untitled)"
@@ -109,6 +141,12 @@ def parse_feed(xml_text: str, source_name: str) -> List[Article]:
                 summary=summary,
                 source=source_name,
                 content_html=content_html,
+                display_label=f"{title} — {author}" if author else title,
             )
         )
     return articles
+
+
+async def parse_feed_async(xml: bytes, source_name: str) -> List[Article]:
+    """``parse_feed`` on a worker thread, so a large feed doesn't stall the UI."""
+    return await asyncio.to_thread(parse_feed, xml, source_name)
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .config import cache_dir
+
+# (compound, pos, neu, neg) as returned by VADER.
+Scores = Tuple[float, float, float, float]
+
+# Stay under SQLite's bound-parameter limit on older builds (999).
+_BATCH = 500
+# Rows not looked up for this many days are dropped when the cache is opened.
+_MAX_AGE_DAYS = 30
+
+_lock = threading.Lock()
+_conn: sqlite3.Connection | None = None
+_disabled = False
+
+
+def _today() -> int:
+    return int(time.time() // 86400)
+
+
+def _connect() -> Optional[sqlite3.Connection]:
+    global _conn, _disabled
+    if _conn is not None or _disabled:
+        return _conn
+    try:
+        path = cache_dir() / "tone.sqlite3"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Tones are computed on worker threads; access is serialized by _lock.
+        conn = sqlite3.connect(path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS tone ("
+            "hash TEXT PRIMARY KEY, compound REAL, pos REAL, neu REAL, neg REAL,"
+            " last_used INTEGER NOT NULL DEFAULT 0)"
+        )
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(tone)")}
+        if "last_used" not in columns:
+            # Caches from before eviction: their rows age out on this prune.
+            conn.execute("ALTER TABLE tone ADD COLUMN last_used INTEGER NOT NULL DEFAULT 0")
+        conn.execute("DELETE FROM tone WHERE last_used < ?", (_today() - _MAX_AGE_DAYS,))
+        conn.commit()
+    except (OSError, sqlite3.Error):
+        # A cache we can't open (read-only home, locked file) just means recomputing.
+        _disabled = True
+        return None
+    _conn = conn
+    return conn
+
+
+def get(key_hash: str) -> Optional[Scores]:
+    with _lock:
+        conn = _connect()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT compound, pos, neu, neg, last_used FROM tone WHERE hash = ?", (key_hash,)
+            ).fetchone()
+            if row is not None and row[4] < _today():
+                _touch(conn, [key_hash])
+        except sqlite3.Error:
+            return None
+    if row is None:
+        return None
+    return (float(row[0]), float(row[1]), float(row[2]), float(row[3]))
+
+
+def _touch(conn: sqlite3.Connection, key_hashes: List[str]) -> None:
+    # last_used has day granularity, so a row is rewritten at most once a day.
+    if key_hashes:
+        today = _today()
+        with conn:
+            conn.executemany(
+                "UPDATE tone SET last_used = ? WHERE hash = ?", [(today, h) for h in key_hashes]
+            )
+
+
+def put(key_hash: str, scores: Scores) -> None:
+    with _lock:
+        conn = _connect()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO tone (hash, compound, pos, neu, neg, last_used)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key_hash, *scores, _today()),
+            )
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+
+def get_many(key_hashes: List[str]) -> Dict[str, Scores]:
+    """Look up several hashes at once; misses are simply absent from the result."""
+    found: Dict[str, Scores] = {}
+    stale: List[str] = []
+    today = _today()
+    with _lock:
+        conn = _connect()
+        if conn is None:
+            return found
+        try:
+            for start in range(0, len(key_hashes), _BATCH):
+                batch = key_hashes[start : start + _BATCH]
+                marks = ",".join("?" * len(batch))
+                for row in conn.execute(
+                    f"SELECT hash, compound, pos, neu, neg, last_used FROM tone WHERE hash IN ({marks})",
+                    batch,
+                ):
+                    found[row[0]] = (float(row[1]), float(row[2]), float(row[3]), float(row[4]))
+                    if row[5] < today:
+                        stale.append(row[0])
+            _touch(conn, stale)
+        except sqlite3.Error:
+            pass
+    return found
+
+
+def put_many(items: Iterable[Tuple[str, Scores]]) -> None:
+    """Store several results in a single transaction."""
+    today = _today()
+    rows = [(key_hash, *scores, today) for key_hash, scores in items]
+    if not rows:
+        return
+    with _lock:
+        conn = _connect()
+        if conn is None:
+            return
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO tone (hash, compound, pos, neu, neg, last_used)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+        except sqlite3.Error:
+            pass
@@ -0,0 +1,44 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from newscli.app import NewsApp
+from newscli.config import Source
+
+
+class TestPrefetch(unittest.TestCase):
+    def test_feeds_are_cached_without_waiting_for_the_slowest(self) -> None:
+        sources = [Source(f"feed {i}", f"https://example.com/{i}") for i in range(4)]
+        slow_url = sources[0].url
+        release = asyncio.Event()
+
+        async def fake_fetch(url: str) -> bytes:
+            if url == slow_url:
+                await release.wait()
+            return url.encode()
+
+        async def fake_store(self: NewsApp, source: Source, xml: bytes) -> list:
+            self._feed_cache[source.url] = []
+            return []
+
+        async def run() -> None:
+            app = NewsApp()
+            task = asyncio.create_task(app._prefetch_feeds(sources))
+            for _ in range(100):
+                if len(app._feed_cache) == 3:
+                    break
+                await asyncio.sleep(0.01)
+            self.assertEqual(set(app._feed_cache), {src.url for src in sources[1:]})
+            self.assertFalse(task.done())
+            release.set()
+            await task
+            self.assertIn(slow_url, app._feed_cache)
+
+        with mock.patch("newscli.app.load_sources", return_value=sources), mock.patch(
+            "newscli.app.fetch_feed", fake_fetch
+        ), mock.patch.object(NewsApp, "_store_feed", fake_store):
+            asyncio.run(run())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
+import asyncio
 import unittest
+from unittest import mock
 
-from newscli.article import DEFAULT_HEADERS, extract_readable_text
+from newscli.article import DEFAULT_HEADERS, _clean_text, extract_readable_text, fetch_article_text
 
 
 class TestArticleHeaders(unittest.TestCase):
@@ -12,6 +14,12 @@ class TestArticleHeaders(unittest.TestCase):
 
 
 class TestReadableText(unittest.TestCase):
+    def test_clean_text_whitespace(self) -> None:
+        raw = "  One  \nTwo\t\n\n \n\t\nThree\n\n  Four \n"
+        self.assertEqual(_clean_text(raw), "One\nTwo\n\nThree\n\n  Four")
+        # Only spaces/tabs count as blank; other whitespace is kept mid-text.
+        self.assertEqual(_clean_text("\n\n\na\r\n\n\n\nb \t"), "a\r\n\nb")
+
     def test_plain_text_mirror_metadata_stripped(self) -> None:
         plain = (
             "Title: Example Mirror Title\n\n"
@@ -50,6 +58,39 @@ class TestReadableText(unittest.TestCase):
         self.assertIn("https://example.com/cover.jpg", content.images)
         self.assertIn("https://example.com/img/inline.png", content.images)
 
+    def test_best_container_prefers_paragraphs_over_link_lists(self) -> None:
+        links = "".join(f"<li><a href=\"/s{i}\">Related story number {i} headline</a></li>" for i in range(12))
+        paras = "".join(
+            f"<p>Paragraph {i} of the story body, long enough to count as real prose.</p>" for i in range(4)
+        )
+        html = (
+            "<html><body>"
+            f"<div class=\"sidebar\"><ul>{links}</ul></div>"
+            f"<div class=\"story-content\">{paras}</div>"
+            "</body></html>"
+        )
+        content = extract_readable_text(html, base_url="https://example.com/story")
+        self.assertIn("Paragraph 0 of the story body", content.text)
+        self.assertNotIn("Related story number", content.text)
+
+    def test_deeply_nested_markup(self) -> None:
+        body = "Deeply nested paragraph text. " * 8
+        html = "<html><body>" + "<div>" * 2000 + f"<p>{body}</p>" + "</div>" * 2000 + "</body></html>"
+        content = extract_readable_text(html)
+        self.assertIn("Deeply nested paragraph text.", content.text)
+
+    def test_html_comments_not_in_text(self) -> None:
+        html = (
+            "<html><body><article><h1>Title</h1>"
+            "<!-- tracking: do not show -->"
+            "<p>Visible paragraph.<!-- inline note --></p>"
+            "</article></body></html>"
+        )
+        content = extract_readable_text(html)
+        self.assertIn("Visible paragraph.", content.text)
+        self.assertNotIn("tracking", content.text)
+        self.assertNotIn("inline note", content.text)
+
     def test_straits_times_boilerplate_removed(self) -> None:
         html = (
             "<html><body><article>"
@@ -90,5 +131,13 @@ class TestReadableText(unittest.TestCase):
         self.assertIn("actual story starts here", content.text.lower())
 
 
+class TestFetchArticleText(unittest.TestCase):
+    def test_full_text_feed_content_skips_fetch(self) -> None:
+        content_html = "".join(f"<p>Paragraph {i} of the full article body from the feed.</p>" for i in range(40))
+        with mock.patch("newscli.article.fetch_html", side_effect=AssertionError("fetched")):
+            content = asyncio.run(fetch_article_text("https://example.com/a", content_html=content_html))
+        self.assertIn("Paragraph 39 of the full article body", content.text)
+
+
 if __name__ == "__main__":
     unittest.main()
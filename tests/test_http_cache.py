@@ -0,0 +1,70 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import httpx
+
+from newscli import http_cache
+from newscli.http_cache import cached_get
+
+
+class TestHttpCache(unittest.TestCase):
+    def setUp(self) -> None:
+        # Don't let a developer's NEWSCLI_HTTP_CACHE=0 turn these into no-ops.
+        env = mock.patch.dict(os.environ, {"NEWSCLI_HTTP_CACHE": "1"})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def test_not_modified_replays_cached_body(self) -> None:
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200, headers={"ETag": '"v1"', "Content-Type": "text/html"}, content=b"<p>hello</p>"
+            )
+
+        async def fetch_twice() -> tuple[httpx.Response, httpx.Response]:
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                first = await cached_get(client, "https://example.com/a", {})
+                second = await cached_get(client, "https://example.com/a", {})
+                return first, second
+
+        with tempfile.TemporaryDirectory() as tmp:
+            with mock.patch("newscli.http_cache.cache_dir", return_value=Path(tmp)):
+                first, second = asyncio.run(fetch_twice())
+
+        self.assertNotIn("If-None-Match", seen[0].headers)
+        self.assertEqual(seen[1].headers.get("If-None-Match"), '"v1"')
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.text, first.text)
+        self.assertEqual(second.headers.get("content-type"), "text/html")
+
+    def test_cache_is_capped(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, headers={"ETag": '"v1"'}, content=request.url.path.encode())
+
+        async def fetch_all() -> None:
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                for i in range(5):
+                    await cached_get(client, f"https://example.com/{i}", {})
+
+        with tempfile.TemporaryDirectory() as tmp:
+            with mock.patch("newscli.http_cache.cache_dir", return_value=Path(tmp)), mock.patch(
+                "newscli.http_cache._MAX_ENTRIES", 3
+            ):
+                with mock.patch("newscli.http_cache._prune", wraps=http_cache._prune) as prune:
+                    asyncio.run(fetch_all())
+                self.assertEqual(len(list((Path(tmp) / "http").glob("*.json"))), 3)
+                self.assertEqual(len(list((Path(tmp) / "http").glob("*.body"))), 3)
+                # The directory is only listed once the cap is exceeded.
+                self.assertEqual(prune.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
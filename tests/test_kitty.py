@@ -1,6 +1,8 @@
+import base64
+import re
 import unittest
 
-from newscli.app import _kitty_image_escape
+from newscli.app import KittyImageRenderable, _kitty_image_escape
 
 
 class TestKittyEscape(unittest.TestCase):
@@ -10,6 +12,18 @@ class TestKittyEscape(unittest.TestCase):
         self.assertIn("\x1b_G", esc)
         self.assertTrue(esc.endswith("\x1b\\"))
 
+    def test_kitty_escape_splits_large_payloads(self) -> None:
+        data = bytes(range(256)) * 16  # 5464 bytes of base64: two chunks
+        esc = _kitty_image_escape(data, cols=40, rows=10)
+        chunks = re.findall(r"\x1b_G([^;]*);([^\x1b]*)\x1b\\", esc)
+        self.assertEqual([params for params, _ in chunks], ["a=T,t=d,c=40,r=10,m=1", "m=0"])
+        self.assertTrue(all(len(payload) <= 4096 for _, payload in chunks))
+        self.assertEqual(base64.b64decode("".join(payload for _, payload in chunks)), data)
+
+        segments = KittyImageRenderable(data, 40, 10).__rich_console__(None, None)
+        rendered = "".join(seg.text for seg in segments)
+        self.assertEqual(rendered, esc + "\n" * 10)
+
 
 if __name__ == "__main__":
     unittest.main()
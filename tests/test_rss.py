@@ -0,0 +1,58 @@
+import asyncio
+import os
+import unittest
+from unittest import mock
+
+import httpx
+
+from newscli.config import Source
+from newscli.rss import fetch_all_feeds
+
+_RSS = b'<?xml version="1.0"?><rss version="2.0"><channel><title>%s</title></channel></rss>'
+
+
+class TestFetchAllFeeds(unittest.TestCase):
+    def setUp(self) -> None:
+        # Keep the on-disk HTTP cache out of it; every request hits the handler.
+        env = mock.patch.dict(os.environ, {"NEWSCLI_HTTP_CACHE": "0"})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def test_order_failures_and_concurrency(self) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                n = int(request.url.path.strip("/"))
+                # Later feeds finish first, so order can't come from completion.
+                await asyncio.sleep(0.01 * (10 - n))
+                if n == 3:
+                    return httpx.Response(404)
+                return httpx.Response(200, content=_RSS % str(n).encode())
+            finally:
+                in_flight -= 1
+
+        sources = [Source(f"feed {i}", f"https://example.com/{i}") for i in range(10)]
+
+        async def run() -> list:
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return await fetch_all_feeds(sources, concurrency=3, client=client)
+
+        results = asyncio.run(run())
+
+        self.assertEqual([src for src, _ in results], sources)
+        for i, (_, result) in enumerate(results):
+            if i == 3:
+                self.assertIsInstance(result, httpx.HTTPStatusError)
+            else:
+                self.assertEqual(result, _RSS % str(i).encode())
+        self.assertLessEqual(peak, 3)
+        self.assertGreater(peak, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from newscli import analysis, tone_cache
+
+
+class TestToneCache(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        patcher = mock.patch("newscli.tone_cache.cache_dir", return_value=self.tmp)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self._reset()
+        self.addCleanup(self._reset)
+
+    def _reset(self) -> None:
+        if tone_cache._conn is not None:
+            tone_cache._conn.close()
+        tone_cache._conn = None
+        tone_cache._disabled = False
+        analysis._analyze_cleaned.cache_clear()
+
+    def test_put_get_round_trip(self) -> None:
+        self.assertIsNone(tone_cache.get("abc"))
+        tone_cache.put("abc", (0.5, 0.3, 0.6, 0.1))
+        self.assertEqual(tone_cache.get("abc"), (0.5, 0.3, 0.6, 0.1))
+
+        tone_cache.put_many([("def", (-0.2, 0.0, 0.8, 0.2))])
+        self.assertEqual(
+            tone_cache.get_many(["abc", "def", "missing"]),
+            {"abc": (0.5, 0.3, 0.6, 0.1), "def": (-0.2, 0.0, 0.8, 0.2)},
+        )
+
+    def test_cache_hit_skips_vader(self) -> None:
+        first = analysis.analyze_tone("Markets rally on strong earnings")
+        analysis._analyze_cleaned.cache_clear()
+        with mock.patch("newscli.analysis._get_analyzer") as get_analyzer:
+            second = analysis.analyze_tone("Markets rally on strong earnings")
+            batch = analysis.analyze_tones(["Markets  rally on strong earnings"])
+        get_analyzer.assert_not_called()
+        self.assertEqual(second, first)
+        self.assertEqual(batch, [first])
+
+    def test_unused_rows_expire_on_connect(self) -> None:
+        with mock.patch("newscli.tone_cache._today", return_value=1000):
+            tone_cache.put("old", (0.5, 0.3, 0.6, 0.1))
+            tone_cache.put_many([("used", (0.1, 0.1, 0.8, 0.1))])
+        with mock.patch("newscli.tone_cache._today", return_value=1020):
+            self.assertIn("used", tone_cache.get_many(["used"]))
+        self._reset()
+        with mock.patch("newscli.tone_cache._today", return_value=1040):
+            self.assertIsNone(tone_cache.get("old"))
+            self.assertIsNotNone(tone_cache.get("used"))
+
+    def test_cache_without_last_used_is_upgraded(self) -> None:
+        conn = sqlite3.connect(self.tmp / "tone.sqlite3")
+        conn.execute(
+            "CREATE TABLE tone (hash TEXT PRIMARY KEY, compound REAL, pos REAL, neu REAL, neg REAL)"
+        )
+        conn.execute("INSERT INTO tone VALUES ('abc', 0.5, 0.3, 0.6, 0.1)")
+        conn.commit()
+        conn.close()
+
+        self.assertIsNone(tone_cache.get("abc"))
+        tone_cache.put("abc", (0.5, 0.3, 0.6, 0.1))
+        self.assertEqual(tone_cache.get("abc"), (0.5, 0.3, 0.6, 0.1))
+
+    def test_unopenable_path_disables_cache(self) -> None:
+        # A file where the cache directory should be makes mkdir fail.
+        blocker = self.tmp / "blocker"
+        blocker.write_text("")
+        with mock.patch("newscli.tone_cache.cache_dir", return_value=blocker / "sub"):
+            tone_cache.put("abc", (0.5, 0.3, 0.6, 0.1))
+            self.assertIsNone(tone_cache.get("abc"))
+            self.assertEqual(tone_cache.get_many(["abc"]), {})
+            self.assertIsNotNone(analysis.analyze_tone("A perfectly fine day"))
+        self.assertTrue(tone_cache._disabled)
+
+
+if __name__ == "__main__":
+    unittest.main()